@@ -1,9 +1,8 @@
 import json
 import logging
-from dataclasses import asdict
-from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
+from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import Event as OTelEvent
 from opentelemetry.sdk.trace import ReadableSpan as OTelReadableSpan
 from opentelemetry.trace import Span as OTelSpan
@@ -23,6 +22,8 @@ from mlflow.tracing.utils import (
 
 _logger = logging.getLogger(__name__)
 
+_EMPTY_RESOURCE = Resource.get_empty()
+
 
 # Not using enum as we want to allow custom span type string.
 class SpanType:
@@ -52,6 +53,9 @@ class Span:
     represented by the :py:class:`LiveSpan <mlflow.entities.LiveSpan>` subclass.
     """
 
+    # Subclasses should define __slots__ too, otherwise instances get a __dict__ again
+    __slots__ = ("_span", "_attributes")
+
     def __init__(self, otel_span: OTelReadableSpan):
         if not isinstance(otel_span, OTelReadableSpan):
             raise MlflowException(
@@ -66,7 +70,6 @@ class Span:
         self._attributes = _CachedSpanAttributesRegistry(otel_span)
 
     @property
-    @lru_cache(maxsize=1)
     def request_id(self) -> str:
         """
         The request ID of the span, a unique identifier for the trace it belongs to.
@@ -188,7 +191,16 @@ class Span:
             "status_code": self.status.status_code.value,
             "status_message": self.status.description,
             "attributes": dict(self._span.attributes),
-            "events": [asdict(event) for event in self.events],
+            # NB: Build event dicts directly from the OpenTelemetry events rather than calling
+            #   dataclasses.asdict() on SpanEvent, which recursively deep-copies every field.
+            "events": [
+                {
+                    "name": event.name,
+                    "timestamp": event.timestamp,
+                    "attributes": dict(event.attributes),
+                }
+                for event in self._span.events
+            ],
         }
 
     @classmethod
@@ -212,6 +224,10 @@ class Span:
                 name=data["name"],
                 context=build_otel_context(trace_id, span_id),
                 parent=build_otel_context(trace_id, parent_id) if parent_id else None,
+                # NB: ReadableSpan creates a new Resource with Resource.create() when it is not
+                #   provided, which runs OpenTelemetry's resource detection for every span.
+                #   The resource is not part of the serialized span, so pass the shared empty one.
+                resource=_EMPTY_RESOURCE,
                 start_time=data["start_time"],
                 end_time=data["end_time"],
                 attributes=data["attributes"],
@@ -242,6 +258,8 @@ class LiveSpan(Span):
     object is returned to get and set the span attributes, status, events, and etc.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         otel_span: OTelSpan,
@@ -380,6 +398,8 @@ class NoOpSpan(Span):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         self._attributes = {}
 
@@ -437,6 +457,35 @@ class NoOpSpan(Span):
         pass
 
 
+class _UnsampledSpan(NoOpSpan):
+    """
+    No-op span for a trace that is not sampled.
+
+    Unlike NoOpSpan, this carries the IDs of the span, so that they can be passed to the
+    MlflowClient APIs like start_span() and end_trace(), which are no-op for the trace.
+    """
+
+    __slots__ = ("_request_id", "_span_id", "_parent_id")
+
+    def __init__(self, request_id: str, span_id: str, parent_id: Optional[str] = None):
+        super().__init__()
+        self._request_id = request_id
+        self._span_id = span_id
+        self._parent_id = parent_id
+
+    @property
+    def request_id(self):
+        return self._request_id
+
+    @property
+    def span_id(self):
+        return self._span_id
+
+    @property
+    def parent_id(self):
+        return self._parent_id
+
+
 class _SpanAttributesRegistry:
     """
     A utility class to manage the span attributes.
@@ -448,6 +497,8 @@ class _SpanAttributesRegistry:
     without worrying about the serde process.
     """
 
+    __slots__ = ("_span",)
+
     def __init__(self, otel_span: OTelSpan):
         self._span = otel_span
 
@@ -485,9 +536,19 @@ class _CachedSpanAttributesRegistry(_SpanAttributesRegistry):
     spans that are immutable, and thus implemented as a subclass of _SpanAttributesRegistry.
     """
 
-    @lru_cache(maxsize=128)
+    # NB: The decoded values are cached per span instance. A functools.lru_cache on the method
+    #   would be shared by all spans in the process, so a trace with many spans keeps evicting
+    #   the entries of its own spans (and holds references to the cached spans).
+    __slots__ = ("_cache",)
+
+    def __init__(self, otel_span: OTelReadableSpan):
+        super().__init__(otel_span)
+        self._cache = {}
+
     def get(self, key: str):
-        return super().get(key)
+        if key not in self._cache:
+            self._cache[key] = super().get(key)
+        return self._cache[key]
 
     def set(self, key: str, value: Any):
         raise MlflowException(
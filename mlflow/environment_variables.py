@@ -539,6 +539,7 @@ MLFLOW_GATEWAY_RATE_LIMITS_STORAGE_URI = _EnvironmentVariable(
 )
 
 #: If True, MLflow fluent logging APIs, e.g., `mlflow.log_metric` will log asynchronously.
+#: Completed traces are also logged to the tracking backend in a background thread.
 MLFLOW_ENABLE_ASYNC_LOGGING = _BooleanEnvironmentVariable("MLFLOW_ENABLE_ASYNC_LOGGING", False)
 
 #: Number of workers in the thread pool used for asynchronous logging, defaults to 10.
@@ -546,6 +547,12 @@ MLFLOW_ASYNC_LOGGING_THREADPOOL_SIZE = _EnvironmentVariable(
     "MLFLOW_ASYNC_LOGGING_THREADPOOL_SIZE", int, 10
 )
 
+#: Maximum number of traces waiting to be logged asynchronously. When the limit is reached,
+#: the traced call blocks until a pending trace is logged. (default: ``1000``)
+MLFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE = _EnvironmentVariable(
+    "MLFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE", int, 1000
+)
+
 #: Specifies whether or not to have mlflow configure logging on import.
 #: If set to True, mlflow will configure ``mlflow.<module_name>`` loggers with
 #: logging handlers and formatters.
@@ -579,6 +586,20 @@ MLFLOW_TRACE_BUFFER_TTL_SECONDS = _EnvironmentVariable("MLFLOW_TRACE_BUFFER_TTL_
 # How many traces to be buffered at the in-memory trace client.
 MLFLOW_TRACE_BUFFER_MAX_SIZE = _EnvironmentVariable("MLFLOW_TRACE_BUFFER_MAX_SIZE", int, 1000)
 
+#: Specifies the ratio of traces to be sampled, between 0.0 and 1.0. Traces that are not
+#: sampled are not recorded nor logged, and their spans skip all processing. The sampling
+#: decision is made when the root span is started and applied to all its child spans.
+#: (default: ``1.0``)
+MLFLOW_TRACE_SAMPLING_RATIO = _EnvironmentVariable("MLFLOW_TRACE_SAMPLING_RATIO", float, 1.0)
+
+#: Specifies the maximum number of threads used to download the trace data in parallel in
+#: ``mlflow.search_traces`` and ``MlflowClient.search_traces``. Downloading is I/O-bound,
+#: so the default is larger than the number of CPUs.
+#: (default: ``min(32, 5 * <number of CPUs>)``)
+MLFLOW_SEARCH_TRACES_MAX_THREADS = _EnvironmentVariable(
+    "MLFLOW_SEARCH_TRACES_MAX_THREADS", int, min(32, (os.cpu_count() or 1) * 5)
+)
+
 #: Whether or not to enable trace logging in model serving.
 #: The default value is set to False to ensure that this flag is only enabled
 #: when our internal safety mechanism on Databricks explicitly sets it to True.
@@ -137,3 +137,19 @@ class LocalArtifactRepository(ArtifactRepository):
         """
         trace_data_path = os.path.join(self.artifact_dir, TRACE_DATA_FILE_NAME)
         return try_read_trace_data(trace_data_path)
+
+    def upload_trace_data(self, trace_data: str) -> None:
+        """
+        Upload the trace data.
+
+        The trace data is written directly to the artifact directory instead of being written
+        to a temporary file first and then copied over.
+
+        Args:
+            trace_data: The json-serialized trace data to upload.
+        """
+        if not os.path.exists(self.artifact_dir):
+            mkdir(self.artifact_dir)
+        trace_data_path = os.path.join(self.artifact_dir, TRACE_DATA_FILE_NAME)
+        with open(trace_data_path, "w") as f:
+            f.write(trace_data)
@@ -1,10 +1,17 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional, Sequence
 
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExporter
 
 from mlflow.entities.trace import Trace
+from mlflow.environment_variables import (
+    MLFLOW_ASYNC_LOGGING_THREADPOOL_SIZE,
+    MLFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE,
+    MLFLOW_ENABLE_ASYNC_LOGGING,
+)
 from mlflow.tracing.constant import TraceTagKey
 from mlflow.tracing.display import get_display_handler
 from mlflow.tracing.display.display_handler import IPythonTraceDisplayHandler
@@ -15,6 +22,43 @@ from mlflow.tracking.client import MlflowClient
 
 _logger = logging.getLogger(__name__)
 
+# Thread pool for logging traces asynchronously. This is shared by all exporter instances,
+# because a new exporter is created every time the tracer provider is rebuilt by
+# _setup_tracer_provider (e.g. mlflow.tracing.disable() followed by mlflow.tracing.enable())
+# and a per-instance pool would leave idle threads behind.
+_ASYNC_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_ASYNC_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_async_executor() -> ThreadPoolExecutor:
+    global _ASYNC_EXECUTOR
+
+    if _ASYNC_EXECUTOR is None:
+        with _ASYNC_EXECUTOR_LOCK:
+            if _ASYNC_EXECUTOR is None:
+                _ASYNC_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=MLFLOW_ASYNC_LOGGING_THREADPOOL_SIZE.get(),
+                    thread_name_prefix="MlflowTraceLogging",
+                )
+    return _ASYNC_EXECUTOR
+
+
+def _get_async_queue_size() -> int:
+    default = MLFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE.default
+    try:
+        max_queue_size = MLFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE.get()
+    except ValueError as e:
+        _logger.warning(f"{e}. Falling back to the default value {default}.")
+        return default
+
+    if max_queue_size < 1:
+        _logger.warning(
+            f"{MLFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE.name} must be a positive integer, "
+            f"but got {max_queue_size}. Falling back to the default value {default}."
+        )
+        return default
+    return max_queue_size
+
 
 class MlflowSpanExporter(SpanExporter):
     """
@@ -41,6 +85,17 @@ class MlflowSpanExporter(SpanExporter):
         self._display_handler = display_handler or get_display_handler()
         self._trace_manager = InMemoryTraceManager.get_instance()
 
+        # When async logging is enabled, the backend calls for logging traces are executed in
+        # a background thread pool so they don't add the network latency to the traced call.
+        self._async_executor = _get_async_executor() if MLFLOW_ENABLE_ASYNC_LOGGING.get() else None
+        self._pending_futures = set()
+        self._pending_futures_lock = threading.Lock()
+        # Bound the number of pending traces, so the memory doesn't grow unboundedly when
+        # traces are produced faster than they are logged to the backend.
+        self._async_queue_slots = (
+            threading.Semaphore(_get_async_queue_size()) if self._async_executor else None
+        )
+
     def export(self, root_spans: Sequence[ReadableSpan]):
         """
         Export the spans to MLflow backend.
@@ -71,7 +126,44 @@ class MlflowSpanExporter(SpanExporter):
                 self._display_handler.display_traces([trace])
 
             # Log the trace to MLflow
-            self._log_trace(trace)
+            if self._async_executor:
+                self._log_trace_async(trace)
+            else:
+                self._log_trace(trace)
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """
+        Block until all traces submitted for async logging are logged to MLflow backend.
+        This is no-op when async logging is disabled.
+
+        Returns:
+            True if all the pending traces are logged within the timeout, otherwise False.
+        """
+        with self._pending_futures_lock:
+            pending_futures = list(self._pending_futures)
+        _, not_done = wait(pending_futures, timeout=timeout_millis / 1000)
+        return not not_done
+
+    def shutdown(self):
+        """Flush the pending traces before the tracer provider is shut down."""
+        self.force_flush()
+
+    def _log_trace_async(self, trace: Trace):
+        # Block until a slot is available when the queue is full
+        self._async_queue_slots.acquire()
+        try:
+            future = self._async_executor.submit(self._log_trace, trace)
+        except Exception:
+            self._async_queue_slots.release()
+            raise
+        with self._pending_futures_lock:
+            self._pending_futures.add(future)
+        future.add_done_callback(self._discard_future)
+
+    def _discard_future(self, future):
+        with self._pending_futures_lock:
+            self._pending_futures.discard(future)
+        self._async_queue_slots.release()
 
     def _log_trace(self, trace: Trace):
         try:
@@ -79,7 +171,6 @@ class MlflowSpanExporter(SpanExporter):
         except Exception as e:
             _logger.debug(f"Failed to log trace spans as tag to MLflow backend: {e}", exc_info=True)
 
-        # TODO: Make this async
         # The trace is already updated in processor.on_end method
         # so we just log to backend store here
         try:
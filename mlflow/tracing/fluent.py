@@ -12,6 +12,7 @@ from opentelemetry import trace as trace_api
 
 from mlflow import MlflowClient
 from mlflow.entities import LiveSpan, NoOpSpan, SpanType, Trace
+from mlflow.entities.span import _UnsampledSpan
 from mlflow.environment_variables import (
     MLFLOW_TRACE_BUFFER_MAX_SIZE,
     MLFLOW_TRACE_BUFFER_TTL_SECONDS,
@@ -26,6 +27,7 @@ from mlflow.tracing.utils import (
     SPANS_COLUMN_NAME,
     capture_function_input_args,
     encode_span_id,
+    encode_trace_id,
     extract_span_inputs_outputs,
     get_otel_attribute,
     traces_to_df,
@@ -115,6 +117,10 @@ def trace(
     def decorator(fn):
         @functools.wraps(fn)
         def wrapper(*args, **kwargs):
+            # Skip capturing inputs and creating a span when tracing is disabled
+            if not provider.is_tracing_enabled():
+                return fn(*args, **kwargs)
+
             span_name = name or fn.__name__
 
             with start_span(name=span_name, span_type=span_type, attributes=attributes) as span:
@@ -195,12 +201,31 @@ def start_span(
     """
     try:
         otel_span = provider.start_span_in_context(name)
-
-        # Create a new MlflowSpanWrapper and register it to the in-memory trace manager
-        request_id = get_otel_attribute(otel_span, SpanAttributeKey.REQUEST_ID)
-        mlflow_span = LiveSpan(otel_span, request_id=request_id, span_type=span_type)
-        mlflow_span.set_attributes(attributes or {})
-        InMemoryTraceManager.get_instance().register_span(mlflow_span)
+        span_context = otel_span.get_span_context()
+
+        if otel_span.is_recording():
+            # Create a new MlflowSpanWrapper and register it to the in-memory trace manager
+            request_id = get_otel_attribute(otel_span, SpanAttributeKey.REQUEST_ID)
+            mlflow_span = LiveSpan(otel_span, request_id=request_id, span_type=span_type)
+            mlflow_span.set_attributes(attributes or {})
+            InMemoryTraceManager.get_instance().register_span(mlflow_span)
+        elif span_context.is_valid and not span_context.trace_flags.sampled:
+            # The trace is not sampled. The non-recording span is still set to the context
+            # below, so that the child spans follow the same sampling decision.
+            # The new span is not set to the context yet, so the current span is its parent
+            parent_context = trace_api.get_current_span().get_span_context()
+            mlflow_span = _UnsampledSpan(
+                request_id=encode_trace_id(span_context.trace_id),
+                span_id=encode_span_id(span_context.span_id),
+                parent_id=encode_span_id(parent_context.span_id)
+                if parent_context.is_valid
+                else None,
+            )
+            if mlflow_span.parent_id is None:
+                InMemoryTraceManager.get_instance().register_unsampled_trace(mlflow_span.request_id)
+        else:
+            # Tracing is disabled, i.e. the span is an invalid one from the no-op provider
+            mlflow_span = NoOpSpan()
 
     except Exception as e:
         _logger.debug("Failed to start span: %s", e, exc_info=True)
@@ -211,10 +236,12 @@ def start_span(
     try:
         # Setting end_on_exit = False to suppress the default span
         # export and instead invoke MlflowSpanWrapper.end()
-        with trace_api.use_span(mlflow_span._span, end_on_exit=False):
+        with trace_api.use_span(otel_span, end_on_exit=False):
             yield mlflow_span
     finally:
         mlflow_span.end()
+        if isinstance(mlflow_span, _UnsampledSpan) and mlflow_span.parent_id is None:
+            InMemoryTraceManager.get_instance().pop_unsampled_trace(mlflow_span.request_id)
 
 
 @experimental
@@ -1,5 +1,6 @@
 import json
 import logging
+import threading
 import time
 from typing import Any, Dict, Optional
 
@@ -35,6 +36,25 @@ from mlflow.tracking.fluent import _get_experiment_id
 
 _logger = logging.getLogger(__name__)
 
+# Length of the metadata value to keep when truncating, leaving room for the suffix
+_TRUNCATION_LENGTH = MAX_CHARS_IN_TRACE_INFO_METADATA_AND_TAGS - len(TRUNCATION_SUFFIX)
+
+# Set once the warning about logging traces to the default experiment is issued, so that
+# the warning is not repeated for every trace.
+_ISSUED_DEFAULT_EXPERIMENT_WARNING = False
+_ISSUED_DEFAULT_EXPERIMENT_WARNING_LOCK = threading.Lock()
+
+
+def _should_issue_default_experiment_warning() -> bool:
+    """Return True only for the first caller, so concurrent traces don't repeat the warning."""
+    global _ISSUED_DEFAULT_EXPERIMENT_WARNING
+
+    with _ISSUED_DEFAULT_EXPERIMENT_WARNING_LOCK:
+        if _ISSUED_DEFAULT_EXPERIMENT_WARNING:
+            return False
+        _ISSUED_DEFAULT_EXPERIMENT_WARNING = True
+        return True
+
 
 class MlflowSpanProcessor(SimpleSpanProcessor):
     """
@@ -83,7 +103,7 @@ class MlflowSpanProcessor(SimpleSpanProcessor):
             # take precendence over the environment experiment id
             experiment_id = run.info.experiment_id
 
-        if experiment_id == DEFAULT_EXPERIMENT_ID:
+        if experiment_id == DEFAULT_EXPERIMENT_ID and _should_issue_default_experiment_warning():
             _logger.warning(
                 "Creating a trace within the default experiment with id "
                 f"'{DEFAULT_EXPERIMENT_ID}'. It is strongly recommended to not use "
@@ -157,6 +177,12 @@ class MlflowSpanProcessor(SimpleSpanProcessor):
 
         super().on_end(span)
 
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """
+        Wait for the exporter to log the traces submitted for async logging.
+        """
+        return self.span_exporter.force_flush(timeout_millis)
+
     def _update_trace_info(self, trace: _Trace, root_span: OTelReadableSpan):
         """Update the trace info with the final values from the root span."""
         # Q: Why do we need to update timestamp_ms here? We already saved it when start
@@ -186,8 +212,7 @@ class MlflowSpanProcessor(SimpleSpanProcessor):
             return ""
 
         if len(value) > MAX_CHARS_IN_TRACE_INFO_METADATA_AND_TAGS:
-            trunc_length = MAX_CHARS_IN_TRACE_INFO_METADATA_AND_TAGS - len(TRUNCATION_SUFFIX)
-            value = value[:trunc_length] + TRUNCATION_SUFFIX
+            value = value[:_TRUNCATION_LENGTH] + TRUNCATION_SUFFIX
         return value
 
     def _create_trace_info(
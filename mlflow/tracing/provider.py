@@ -4,8 +4,10 @@ from typing import Optional, Tuple
 
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 from opentelemetry.util._once import Once
 
+from mlflow.environment_variables import MLFLOW_TRACE_SAMPLING_RATIO
 from mlflow.tracing.constant import SpanAttributeKey
 from mlflow.utils.databricks_utils import is_in_databricks_model_serving_environment
 
@@ -85,11 +87,61 @@ def _setup_tracer_provider():
         exporter = MlflowSpanExporter()
         processor = MlflowSpanProcessor(exporter)
 
-    tracer_provider = TracerProvider()
+    if MLFLOW_TRACE_SAMPLING_RATIO.defined:
+        # Sampling decision is made for the root span and inherited by the child spans. The spans
+        # of unsampled traces are non-recording, so the span processor is not invoked for them.
+        sampler = ParentBased(root=TraceIdRatioBased(_get_sampling_ratio()))
+        tracer_provider = TracerProvider(sampler=sampler)
+    else:
+        # Leave the sampler to the OpenTelemetry SDK, so OTEL_TRACES_SAMPLER is respected
+        tracer_provider = TracerProvider()
     tracer_provider.add_span_processor(processor)
     trace.set_tracer_provider(tracer_provider)
 
 
+def _get_sampling_ratio() -> float:
+    """
+    Get the trace sampling ratio from the environment variable. An invalid value falls back
+    to the default, so that a misconfiguration doesn't disable tracing silently.
+    """
+    try:
+        ratio = MLFLOW_TRACE_SAMPLING_RATIO.get()
+    except ValueError as e:
+        _logger.warning(f"{e}. Falling back to sampling all traces.")
+        return MLFLOW_TRACE_SAMPLING_RATIO.default
+
+    if not 0.0 <= ratio <= 1.0:
+        _logger.warning(
+            f"{MLFLOW_TRACE_SAMPLING_RATIO.name} must be between 0.0 and 1.0, but got {ratio}. "
+            "Falling back to sampling all traces."
+        )
+        return MLFLOW_TRACE_SAMPLING_RATIO.default
+    return ratio
+
+
+def flush_async_logging():
+    """
+    Block until all traces submitted for async logging are logged to the backend. This is no-op
+    when the tracer provider is not initialized or tracing is disabled.
+    """
+    tracer_provider = trace.get_tracer_provider()
+    if isinstance(tracer_provider, TracerProvider):
+        tracer_provider.force_flush()
+
+
+def is_tracing_enabled() -> bool:
+    """
+    Check if tracing is enabled, i.e. the global tracer provider is not a NoOpTracerProvider.
+
+    The tracer provider is lazily initialized on the first span creation, so tracing is
+    regarded as enabled until then. This check is cheap and intended to be used for
+    skipping the span creation logic entirely when tracing is disabled.
+    """
+    if not _TRACER_PROVIDER_INITIALIZED._done:
+        return True
+    return not isinstance(trace.get_tracer_provider(), trace.NoOpTracerProvider)
+
+
 def disable():
     """
     Disable tracing by setting the global tracer provider to NoOpTracerProvider.
@@ -102,6 +154,9 @@ def disable():
         trace._TRACER_PROVIDER_SET_ONCE._done = False
 
     trace.set_tracer_provider(trace.NoOpTracerProvider())
+    # Mark the tracer provider as initialized, so the lazy setup in _get_tracer() is skipped
+    # and is_tracing_enabled() can tell that tracing is disabled from the first call.
+    _TRACER_PROVIDER_INITIALIZED.do_once(lambda: None)
 
 
 def enable():
@@ -1,7 +1,6 @@
 import contextlib
 import logging
 import threading
-from dataclasses import dataclass, field
 from typing import Dict, Generator, Optional
 
 from cachetools import TTLCache
@@ -18,10 +17,13 @@ _logger = logging.getLogger(__name__)
 
 # Internal representation to keep the state of a trace.
 # Dict[str, Span] is used instead of TraceData to allow access by span_id.
-@dataclass
 class _Trace:
-    info: TraceInfo
-    span_dict: Dict[str, LiveSpan] = field(default_factory=dict)
+    # Not a dataclass, because dataclass(slots=True) requires Python 3.10
+    __slots__ = ("info", "span_dict")
+
+    def __init__(self, info: TraceInfo, span_dict: Optional[Dict[str, LiveSpan]] = None):
+        self.info = info
+        self.span_dict = span_dict if span_dict is not None else {}
 
     def to_mlflow_trace(self) -> Trace:
         trace_data = TraceData()
@@ -59,6 +61,12 @@ class InMemoryTraceManager:
         )
         # Store mapping between OpenTelemetry trace ID and MLflow request ID
         self._trace_id_to_request_id: Dict[int, str] = {}
+        # Request IDs of the traces that are not sampled. Used as a set, but bounded in the
+        # same way as _traces in case the traces are never ended.
+        self._unsampled_request_ids: Dict[str, bool] = TTLCache(
+            maxsize=MLFLOW_TRACE_BUFFER_MAX_SIZE.get(),
+            ttl=MLFLOW_TRACE_BUFFER_TTL_SECONDS.get(),
+        )
         self._lock = threading.Lock()  # Lock for _traces
 
     def register_trace(self, trace_id: int, trace_info: TraceInfo):
@@ -73,6 +81,28 @@ class InMemoryTraceManager:
             self._traces[trace_info.request_id] = _Trace(trace_info)
             self._trace_id_to_request_id[trace_id] = trace_info.request_id
 
+    def register_unsampled_trace(self, request_id: str):
+        """
+        Register the request ID of a trace that is not sampled, so that the client APIs
+        called for the trace can be no-op instead of failing to find the trace.
+        """
+        with self._lock:
+            self._unsampled_request_ids[request_id] = True
+
+    def is_unsampled_trace(self, request_id: str) -> bool:
+        """
+        Check if the trace with the given request ID is registered as not sampled.
+        """
+        with self._lock:
+            return request_id in self._unsampled_request_ids
+
+    def pop_unsampled_trace(self, request_id: str) -> bool:
+        """
+        Remove the given request ID from the unsampled traces. Return True if it was registered.
+        """
+        with self._lock:
+            return self._unsampled_request_ids.pop(request_id, None) is not None
+
     def update_trace_info(self, trace_info: TraceInfo):
         """
         Update the trace info object in the in-memory trace registry.
@@ -162,3 +192,4 @@ class InMemoryTraceManager:
         """Clear all the aggregated trace data. This should only be used for testing."""
         with self._lock:
             self._traces.clear()
+            self._unsampled_request_ids.clear()
@@ -133,14 +133,19 @@ def deduplicate_span_names_in_place(spans: List[LiveSpan]):
     Args:
         spans: A list of spans to deduplicate.
     """
-    span_name_counter = Counter(span.name for span in spans)
+    # Read each name once, as the name property goes through the span wrapper
+    span_names = [span.name for span in spans]
+    span_name_counter = Counter(span_names)
+    # Most traces have no duplicated span names, so skip the renaming pass entirely
+    if len(span_name_counter) == len(span_names):
+        return
     # Apply renaming only for duplicated spans
     span_name_counter = {name: 1 for name, count in span_name_counter.items() if count > 1}
     # Add index to the duplicated span names
-    for span in spans:
-        if count := span_name_counter.get(span.name):
-            span_name_counter[span.name] += 1
-            span._span._name = f"{span.name}_{count}"
+    for span, name in zip(spans, span_names):
+        if count := span_name_counter.get(name):
+            span_name_counter[name] += 1
+            span._span._name = f"{name}_{count}"
 
 
 def get_otel_attribute(span: trace_api.Span, key: str) -> Optional[str]:
@@ -317,20 +322,22 @@ def _extract_from_traces_pandas_df(
             error_code=INVALID_PARAMETER_VALUE,
         )
 
-    new_columns: Dict[str, List[Any]] = defaultdict(list)
-    for _, row in df.iterrows():
+    # Format the column names once rather than for every row
+    new_columns: Dict[str, List[Any]] = {str(field): [] for field in fields}
+    field_columns = [(field, new_columns[str(field)]) for field in fields]
+    for row_content in df[col_name]:
         spans_dict: Dict[str, List[Span]] = defaultdict(list)
-        for span in _extract_spans_from_row(row[col_name]):
+        for span in _extract_spans_from_row(row_content):
             spans_dict[span.name].append(span)
 
-        for field in fields:
+        for field, column in field_columns:
             matching_spans = spans_dict.get(field.span_name, [])
             matching_value = _find_matching_value(field, matching_spans)
-            new_columns[str(field)].append(matching_value)
+            column.append(matching_value)
 
     df_with_new_fields = df.copy()
-    for field in fields:
-        df_with_new_fields[str(field)] = new_columns[str(field)]
+    for column_name, values in new_columns.items():
+        df_with_new_fields[column_name] = values
 
     return df_with_new_fields
 
@@ -17,6 +17,7 @@ import warnings
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
 
 import yaml
+from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
 
 import mlflow
 from mlflow.entities import (
@@ -37,7 +38,7 @@ from mlflow.entities import (
 )
 from mlflow.entities.model_registry import ModelVersion, RegisteredModel
 from mlflow.entities.model_registry.model_version_stages import ALL_STAGES
-from mlflow.entities.span import LiveSpan, NoOpSpan
+from mlflow.entities.span import LiveSpan, NoOpSpan, _UnsampledSpan
 from mlflow.environment_variables import MLFLOW_ENABLE_ASYNC_LOGGING
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import (
@@ -64,7 +65,12 @@ from mlflow.tracing.constant import (
 )
 from mlflow.tracing.display import get_display_handler
 from mlflow.tracing.trace_manager import InMemoryTraceManager
-from mlflow.tracing.utils import exclude_immutable_tags, get_otel_attribute
+from mlflow.tracing.utils import (
+    encode_span_id,
+    encode_trace_id,
+    exclude_immutable_tags,
+    get_otel_attribute,
+)
 from mlflow.tracking._model_registry import DEFAULT_AWAIT_MAX_SLEEP_SECONDS
 from mlflow.tracking._model_registry import utils as registry_utils
 from mlflow.tracking._model_registry.client import ModelRegistryClient
@@ -575,6 +581,16 @@ class MlflowClient:
             otel_span = mlflow.tracing.provider.start_detached_span(
                 name, experiment_id=experiment_id
             )
+            span_context = otel_span.get_span_context()
+            if not span_context.is_valid:
+                # Tracing is disabled, i.e. the span is an invalid one from the no-op provider
+                return NoOpSpan()
+            if not otel_span.is_recording():
+                # The trace is not sampled. Keep track of its request ID so the subsequent
+                # client calls for the trace, e.g. start_span() and end_trace(), are no-op.
+                request_id = encode_trace_id(span_context.trace_id)
+                InMemoryTraceManager.get_instance().register_unsampled_trace(request_id)
+                return _UnsampledSpan(request_id, encode_span_id(span_context.span_id))
             request_id = get_otel_attribute(otel_span, SpanAttributeKey.REQUEST_ID)
 
             mlflow_span = LiveSpan(otel_span, request_id, span_type)
@@ -635,6 +651,9 @@ class MlflowClient:
                 e.g. ``"OK"``, ``"ERROR"``. The default status is OK.
         """
         trace_manager = InMemoryTraceManager.get_instance()
+        if trace_manager.pop_unsampled_trace(request_id):
+            return
+
         root_span_id = trace_manager.get_root_span_id(request_id)
 
         if root_span_id is None:
@@ -804,6 +823,10 @@ class MlflowClient:
             )
 
         trace_manager = InMemoryTraceManager.get_instance()
+        if trace_manager.is_unsampled_trace(request_id):
+            span_id = encode_span_id(RandomIdGenerator().generate_span_id())
+            return _UnsampledSpan(request_id, span_id, parent_id)
+
         if not (parent_span := trace_manager.get_span_from_id(request_id, parent_id)):
             raise MlflowException(
                 f"Parent span with ID '{parent_id}' not found.",
@@ -854,6 +877,9 @@ class MlflowClient:
                 e.g. ``"OK"``, ``"ERROR"``. The default status is OK.
         """
         trace_manager = InMemoryTraceManager.get_instance()
+        if trace_manager.is_unsampled_trace(request_id):
+            return
+
         span = trace_manager.get_span_from_id(request_id, span_id)
 
         if span is None:
@@ -663,8 +663,11 @@ def log_param(key: str, value: Any, synchronous: Optional[bool] = None) -> Any:
 
 
 def flush_async_logging() -> None:
-    """Flush all pending async logging."""
+    """Flush all pending async logging, including the traces being logged asynchronously."""
+    from mlflow.tracing.provider import flush_async_logging as flush_trace_async_logging
+
     _get_store().flush_async_logging()
+    flush_trace_async_logging()
 
 
 def flush_artifact_async_logging() -> None:
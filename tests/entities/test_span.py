@@ -1,8 +1,10 @@
 import json
 from datetime import datetime
+from unittest import mock
 
 import opentelemetry.trace as trace_api
 import pytest
+from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import ReadableSpan as OTelReadableSpan
 
 import mlflow
@@ -104,6 +106,29 @@ def test_wrap_non_live_span():
         span.set_inputs({"input": 1})
 
 
+def test_non_live_span_decodes_attribute_once():
+    readable_span = OTelReadableSpan(
+        name="test",
+        context=trace_api.SpanContext(
+            trace_id=12345, span_id=222, is_remote=False, trace_flags=trace_api.TraceFlags(1)
+        ),
+        attributes={
+            "mlflow.traceRequestId": json.dumps("tr-12345"),
+            "mlflow.spanInputs": '{"input": 1}',
+        },
+    )
+    spans = [Span(readable_span), Span(readable_span)]
+
+    with mock.patch("mlflow.entities.span.json.loads", wraps=json.loads) as mock_loads:
+        for _ in range(3):
+            for span in spans:
+                assert span.request_id == "tr-12345"
+                assert span.inputs == {"input": 1}
+
+    # Each span decodes each attribute only once
+    assert mock_loads.call_count == 4
+
+
 def test_wrap_raise_for_invalid_otel_span():
     with pytest.raises(MlflowException, match=r"The `otel_span` argument for the LiveSpan class"):
         LiveSpan(None, request_id="tr-12345")
@@ -148,6 +173,8 @@ def test_dict_conversion(clear_singleton):
     assert span.outputs == recovered_span.outputs
     assert span.attributes == recovered_span.attributes
     assert span.events == recovered_span.events
+    # The loaded span should share the empty resource instead of creating a new one
+    assert recovered_span._span.resource is Resource.get_empty()
 
     # Loaded span should not implement setter methods
     with pytest.raises(AttributeError, match="set_status"):
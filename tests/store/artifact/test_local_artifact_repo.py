@@ -218,3 +218,16 @@ def test_trace_data(local_artifact_repo):
     mock_trace_data = {"spans": [], "request": {"test": 1}, "response": {"test": 2}}
     local_artifact_repo.upload_trace_data(json.dumps(mock_trace_data))
     assert local_artifact_repo.download_trace_data() == mock_trace_data
+
+
+def test_upload_trace_data_creates_artifact_dir(tmp_path):
+    from mlflow.utils.file_utils import path_to_local_file_uri
+
+    artifact_root = tmp_path.joinpath("traces", "tr-123", "artifacts")
+    repo = LocalArtifactRepository(artifact_uri=path_to_local_file_uri(str(artifact_root)))
+
+    mock_trace_data = {"spans": [], "request": {"test": 1}, "response": {"test": 2}}
+    repo.upload_trace_data(json.dumps(mock_trace_data))
+
+    assert os.listdir(artifact_root) == ["traces.json"]
+    assert repo.download_trace_data() == mock_trace_data
@@ -1,11 +1,16 @@
+import threading
+from unittest import mock
 from unittest.mock import MagicMock
 
+import pytest
+
+import mlflow
 from mlflow.entities import LiveSpan
 from mlflow.tracing.export.mlflow import MlflowSpanExporter
 from mlflow.tracing.fluent import TRACE_BUFFER
 from mlflow.tracing.trace_manager import InMemoryTraceManager
 
-from tests.tracing.helper import create_mock_otel_span, create_test_trace_info
+from tests.tracing.helper import create_mock_otel_span, create_test_trace_info, get_traces
 
 
 def test_export():
@@ -54,3 +59,132 @@ def test_export():
     assert trace_info == logged_trace_info
     assert len(logged_trace_data.spans) == 2
     mock_client._upload_ended_trace_info.assert_called_once_with(trace_info)
+
+
+def test_export_async(monkeypatch):
+    monkeypatch.setenv("MLFLOW_ENABLE_ASYNC_LOGGING", "true")
+
+    trace_id = 12345
+    request_id = f"tr-{trace_id}"
+    otel_span = create_mock_otel_span(trace_id=trace_id, span_id=1, start_time=0, end_time=1)
+    trace_info = create_test_trace_info(request_id, 0)
+    trace_manager = InMemoryTraceManager.get_instance()
+    trace_manager.register_trace(trace_id, trace_info)
+    trace_manager.register_span(LiveSpan(otel_span, request_id=request_id))
+
+    upload_started = threading.Event()
+    release_upload = threading.Event()
+
+    def _slow_upload(*args):
+        upload_started.set()
+        release_upload.wait(timeout=10)
+
+    mock_client = MagicMock()
+    mock_client._upload_trace_data.side_effect = _slow_upload
+    exporter = MlflowSpanExporter(mock_client, MagicMock())
+
+    # Export should return without waiting for the backend calls
+    exporter.export([otel_span])
+    assert upload_started.wait(timeout=10)
+    mock_client._upload_ended_trace_info.assert_not_called()
+    assert len(TRACE_BUFFER) == 1
+
+    release_upload.set()
+    exporter.force_flush()
+    mock_client._upload_trace_data.assert_called_once()
+    mock_client._upload_ended_trace_info.assert_called_once_with(trace_info)
+
+
+def test_async_executor_is_shared_across_exporters(monkeypatch):
+    monkeypatch.setenv("MLFLOW_ENABLE_ASYNC_LOGGING", "true")
+
+    exporter_1 = MlflowSpanExporter(MagicMock(), MagicMock())
+    exporter_2 = MlflowSpanExporter(MagicMock(), MagicMock())
+
+    assert exporter_1._async_executor is not None
+    assert exporter_1._async_executor is exporter_2._async_executor
+
+
+def test_export_async_blocks_when_queue_is_full(monkeypatch):
+    monkeypatch.setenv("MLFLOW_ENABLE_ASYNC_LOGGING", "true")
+    monkeypatch.setenv("MLFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE", "1")
+
+    trace_manager = InMemoryTraceManager.get_instance()
+    otel_spans = []
+    for trace_id in [1, 2]:
+        request_id = f"tr-{trace_id}"
+        otel_span = create_mock_otel_span(trace_id=trace_id, span_id=1, start_time=0, end_time=1)
+        trace_manager.register_trace(trace_id, create_test_trace_info(request_id, 0))
+        trace_manager.register_span(LiveSpan(otel_span, request_id=request_id))
+        otel_spans.append(otel_span)
+
+    release_upload = threading.Event()
+    mock_client = MagicMock()
+    mock_client._upload_trace_data.side_effect = lambda *args: release_upload.wait(timeout=10)
+    exporter = MlflowSpanExporter(mock_client, MagicMock())
+
+    exporter.export([otel_spans[0]])
+    # The second export should wait until the first trace is logged
+    thread = threading.Thread(target=exporter.export, args=([otel_spans[1]],))
+    thread.start()
+    thread.join(timeout=0.5)
+    assert thread.is_alive()
+    assert mock_client._upload_trace_data.call_count == 1
+
+    release_upload.set()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    exporter.force_flush()
+    assert mock_client._upload_trace_data.call_count == 2
+
+
+def test_flush_async_logging_waits_for_traces(monkeypatch):
+    monkeypatch.setenv("MLFLOW_ENABLE_ASYNC_LOGGING", "true")
+
+    release_upload = threading.Event()
+    logged_request_ids = []
+    original_log_trace = MlflowSpanExporter._log_trace
+
+    def _slow_log_trace(self, trace):
+        release_upload.wait(timeout=10)
+        original_log_trace(self, trace)
+        logged_request_ids.append(trace.info.request_id)
+
+    @mlflow.trace
+    def predict(x):
+        return x + 1
+
+    with mock.patch.object(MlflowSpanExporter, "_log_trace", _slow_log_trace):
+        predict(1)
+        assert logged_request_ids == []
+
+        release_upload.set()
+        mlflow.flush_async_logging()
+
+    trace = get_traces()[0]
+    assert logged_request_ids == [trace.info.request_id]
+    assert mlflow.MlflowClient().get_trace(trace.info.request_id) is not None
+
+
+@pytest.mark.parametrize("max_queue_size", ["0", "-1", "abc"])
+def test_export_async_with_invalid_queue_size(monkeypatch, max_queue_size):
+    monkeypatch.setenv("MLFLOW_ENABLE_ASYNC_LOGGING", "true")
+    monkeypatch.setenv("MLFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE", max_queue_size)
+
+    trace_id = 12345
+    request_id = f"tr-{trace_id}"
+    otel_span = create_mock_otel_span(trace_id=trace_id, span_id=1, start_time=0, end_time=1)
+    trace_manager = InMemoryTraceManager.get_instance()
+    trace_manager.register_trace(trace_id, create_test_trace_info(request_id, 0))
+    trace_manager.register_span(LiveSpan(otel_span, request_id=request_id))
+
+    mock_client = MagicMock()
+    with mock.patch("mlflow.tracing.export.mlflow._logger.warning") as mock_warning:
+        exporter = MlflowSpanExporter(mock_client, MagicMock())
+    mock_warning.assert_called_once()
+    assert "MLFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE" in mock_warning.call_args[0][0]
+
+    # Export should not block with the fallback queue size
+    exporter.export([otel_span])
+    assert exporter.force_flush()
+    mock_client._upload_trace_data.assert_called_once()
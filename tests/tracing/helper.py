@@ -10,6 +10,61 @@ from mlflow.entities.trace_status import TraceStatus
 from mlflow.tracing.fluent import TRACE_BUFFER
 
 
+@dataclass
+class _MockSpanContext:
+    trace_id: str
+    span_id: str
+    trace_flags: trace_api.TraceFlags = trace_api.TraceFlags(1)
+
+
+class _MockOTelSpan(trace_api.Span, ReadableSpan):
+    def __init__(
+        self,
+        name,
+        context,
+        parent,
+        start_time=None,
+        end_time=None,
+        status=trace_api.Status(trace_api.StatusCode.UNSET),
+    ):
+        self._name = name
+        self._parent = parent
+        self._context = context
+        self._start_time = start_time if start_time is not None else int(time.time() * 1e9)
+        self._end_time = end_time
+        self._status = status
+        self._attributes = {}
+        self._events = []
+
+    # NB: The following methods are defined as abstract method in the Span class.
+    def set_attributes(self, attributes):
+        self._attributes.update(attributes)
+
+    def set_attribute(self, key, value):
+        self._attributes[key] = value
+
+    def set_status(self, status):
+        self._status = status
+
+    def add_event():
+        pass
+
+    def get_span_context(self):
+        return self._context
+
+    def is_recording(self):
+        return self._end_time is None
+
+    def update_name(self, name):
+        self.name = name
+
+    def end(self):
+        pass
+
+    def record_exception():
+        pass
+
+
 def create_mock_otel_span(
     trace_id: int,
     span_id: int,
@@ -24,60 +79,6 @@ def create_mock_otel_span(
     OpenTelemetry doesn't allow creating a span outside of a tracer. So here we create a mock span
     that extends ReadableSpan (data object) and exposes the necessary attributes for testing.
     """
-
-    @dataclass
-    class _MockSpanContext:
-        trace_id: str
-        span_id: str
-        trace_flags: trace_api.TraceFlags = trace_api.TraceFlags(1)
-
-    class _MockOTelSpan(trace_api.Span, ReadableSpan):
-        def __init__(
-            self,
-            name,
-            context,
-            parent,
-            start_time=None,
-            end_time=None,
-            status=trace_api.Status(trace_api.StatusCode.UNSET),
-        ):
-            self._name = name
-            self._parent = parent
-            self._context = context
-            self._start_time = start_time if start_time is not None else int(time.time() * 1e9)
-            self._end_time = end_time
-            self._status = status
-            self._attributes = {}
-            self._events = []
-
-        # NB: The following methods are defined as abstract method in the Span class.
-        def set_attributes(self, attributes):
-            self._attributes.update(attributes)
-
-        def set_attribute(self, key, value):
-            self._attributes[key] = value
-
-        def set_status(self, status):
-            self._status = status
-
-        def add_event():
-            pass
-
-        def get_span_context(self):
-            return self._context
-
-        def is_recording(self):
-            return self._end_time is None
-
-        def update_name(self, name):
-            self.name = name
-
-        def end(self):
-            pass
-
-        def record_exception():
-            pass
-
     return _MockOTelSpan(
         name=name,
         context=_MockSpanContext(trace_id, span_id),
@@ -160,6 +160,23 @@ def test_on_start_fallback_to_client_side_request_id(clear_singleton, monkeypatc
         assert trace.info.status == TraceStatus.IN_PROGRESS
 
 
+def test_on_start_warns_default_experiment_only_once(clear_singleton, monkeypatch):
+    monkeypatch.setattr("mlflow.tracing.processor.mlflow._ISSUED_DEFAULT_EXPERIMENT_WARNING", False)
+    mock_client = mock.MagicMock()
+    mock_client._start_tracked_trace.side_effect = [
+        create_test_trace_info(f"tr-{trace_id}", 0) for trace_id in [1, 2]
+    ]
+    processor = MlflowSpanProcessor(span_exporter=mock.MagicMock(), client=mock_client)
+
+    with mock.patch("mlflow.tracing.processor.mlflow._logger.warning") as mock_warning:
+        processor.on_start(create_mock_otel_span(trace_id=1, span_id=1))
+        processor.on_start(create_mock_otel_span(trace_id=2, span_id=1))
+
+    assert mock_client._start_tracked_trace.call_count == 2
+    mock_warning.assert_called_once()
+    assert "default experiment" in mock_warning.call_args[0][0]
+
+
 def test_on_start_during_model_evaluation(clear_singleton):
     # Root span should create a new trace on start
     span = create_mock_otel_span(trace_id=_TRACE_ID, span_id=1)
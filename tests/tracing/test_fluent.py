@@ -1,7 +1,7 @@
 import json
 import time
-from dataclasses import asdict
 from datetime import datetime
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
@@ -49,6 +49,25 @@ class DefaultTestModel:
         return res
 
 
+def _create_test_model(predict_name, add_one_name):
+    class TestModel:
+        @mlflow.trace(name=predict_name)
+        def predict(self, x, y):
+            z = x + y
+            z = self.add_one(z)
+            z = mlflow.trace(self.square)(z)
+            return z  # noqa: RET504
+
+        @mlflow.trace(span_type=SpanType.LLM, name=add_one_name, attributes={"delta": 1})
+        def add_one(self, z):
+            return z + 1
+
+        def square(self, t):
+            return t**2
+
+    return TestModel()
+
+
 @pytest.fixture
 def mock_client():
     client = mock.MagicMock()
@@ -124,8 +143,7 @@ def test_trace_with_databricks_tracking_uri(
     monkeypatch.setenv(MLFLOW_TRACKING_USERNAME.name, "bob")
     monkeypatch.setattr(mlflow.tracking.context.default_context, "_get_source_name", lambda: "test")
 
-    mock_experiment = mock.MagicMock()
-    mock_experiment.experiment_id = "test_experiment_id"
+    mock_experiment = SimpleNamespace(experiment_id="test_experiment_id")
     monkeypatch.setattr(
         mock_store, "get_experiment_by_name", mock.MagicMock(return_value=mock_experiment)
     )
@@ -261,11 +279,10 @@ def test_trace_in_databricks_model_serving(clear_singleton, monkeypatch):
         "mlflow.traceRequestId": databricks_request_id,
         "mlflow.spanType": SpanType.UNKNOWN,
     }
-    assert asdict(child_span_2.events[0]) == {
-        "name": "event",
-        "timestamp": 0,
-        "attributes": {"foo": "bar"},
-    }
+    event = child_span_2.events[0]
+    assert event.name == "event"
+    assert event.timestamp == 0
+    assert event.attributes == {"foo": "bar"}
 
     # The trace should be removed from the buffer after being retrieved
     assert pop_trace(request_id=databricks_request_id) is None
@@ -621,17 +638,16 @@ def test_search_traces_yields_expected_dataframe_contents(monkeypatch):
         "spans",
         "tags",
     ]
-    for idx, trace in enumerate(traces_to_return):
-        assert df.iloc[idx].request_id == trace.info.request_id
-        assert df.iloc[idx].trace == trace
-        assert df.iloc[idx].timestamp_ms == trace.info.timestamp_ms
-        assert df.iloc[idx].status == trace.info.status
-        assert df.iloc[idx].execution_time_ms == trace.info.execution_time_ms
-        assert df.iloc[idx].request == trace.data.request
-        assert df.iloc[idx].response == trace.data.response
-        assert df.iloc[idx].request_metadata == trace.info.request_metadata
-        assert df.iloc[idx].spans == trace.data.spans
-        assert df.iloc[idx].tags == trace.info.tags
+    assert df["request_id"].tolist() == [t.info.request_id for t in traces_to_return]
+    assert df["trace"].tolist() == traces_to_return
+    assert df["timestamp_ms"].tolist() == [t.info.timestamp_ms for t in traces_to_return]
+    assert df["status"].tolist() == [t.info.status for t in traces_to_return]
+    assert df["execution_time_ms"].tolist() == [t.info.execution_time_ms for t in traces_to_return]
+    assert df["request"].tolist() == [t.data.request for t in traces_to_return]
+    assert df["response"].tolist() == [t.data.response for t in traces_to_return]
+    assert df["request_metadata"].tolist() == [t.info.request_metadata for t in traces_to_return]
+    assert df["spans"].tolist() == [t.data.spans for t in traces_to_return]
+    assert df["tags"].tolist() == [t.info.tags for t in traces_to_return]
 
 
 def test_search_traces_handles_missing_response_tags_and_metadata(monkeypatch):
@@ -757,24 +773,7 @@ def test_search_traces_with_non_dict_span_inputs_outputs(monkeypatch):
 
 # Test case where there are multiple spans with the same name
 def test_search_traces_with_multiple_spans_with_same_name(monkeypatch):
-    class TestModel:
-        @mlflow.trace(name="duplicate_name")
-        def predict(self, x, y):
-            z = x + y
-            z = self.add_one(z)
-            z = mlflow.trace(self.square)(z)
-            return z  # noqa: RET504
-
-        @mlflow.trace(span_type=SpanType.LLM, name="duplicate_name", attributes={"delta": 1})
-        def add_one(self, z):
-            return z + 1
-
-        def square(self, t):
-            res = t**2
-            time.sleep(0.1)
-            return res
-
-    model = TestModel()
+    model = _create_test_model(predict_name="duplicate_name", add_one_name="duplicate_name")
     model.predict(2, 5)
 
     class MockMlflowClient:
@@ -843,24 +842,7 @@ def test_search_traces_without_experiment_id(monkeypatch):
 
 
 def test_search_traces_with_span_name(monkeypatch):
-    class TestModel:
-        @mlflow.trace(name="span.llm")
-        def predict(self, x, y):
-            z = x + y
-            z = self.add_one(z)
-            z = mlflow.trace(self.square)(z)
-            return z  # noqa: RET504
-
-        @mlflow.trace(span_type=SpanType.LLM, name="span.invalidname", attributes={"delta": 1})
-        def add_one(self, z):
-            return z + 1
-
-        def square(self, t):
-            res = t**2
-            time.sleep(0.1)
-            return res
-
-    model = TestModel()
+    model = _create_test_model(predict_name="span.llm", add_one_name="span.invalidname")
     model.predict(2, 5)
 
     class MockMlflowClient:
@@ -1,12 +1,21 @@
+from unittest import mock
+
+import pytest
 from opentelemetry import trace
 
 import mlflow
+from mlflow.entities.span import NoOpSpan
 from mlflow.tracing.export.inference_table import InferenceTableSpanExporter
 from mlflow.tracing.export.mlflow import MlflowSpanExporter
 from mlflow.tracing.fluent import TRACE_BUFFER
 from mlflow.tracing.processor.inference_table import InferenceTableSpanProcessor
 from mlflow.tracing.processor.mlflow import MlflowSpanProcessor
-from mlflow.tracing.provider import _TRACER_PROVIDER_INITIALIZED, _get_tracer
+from mlflow.tracing.provider import (
+    _TRACER_PROVIDER_INITIALIZED,
+    _get_tracer,
+    is_tracing_enabled,
+)
+from mlflow.tracing.trace_manager import InMemoryTraceManager
 
 
 # Mock client getter just to count the number of calls
@@ -62,3 +71,125 @@ def test_disable_enable_tracing():
     assert len(TRACE_BUFFER) == 1
     assert isinstance(_get_tracer(__name__), trace.Tracer)
     TRACE_BUFFER.clear()
+
+
+def test_trace_decorator_skips_span_creation_when_disabled():
+    @mlflow.trace
+    def test_fn(x):
+        return x + 1
+
+    # Tracing is regarded as enabled before the tracer provider is initialized
+    _TRACER_PROVIDER_INITIALIZED._done = False
+    assert is_tracing_enabled()
+
+    mlflow.tracing.disable()
+    assert not is_tracing_enabled()
+
+    with mock.patch("mlflow.tracing.fluent.capture_function_input_args") as mock_capture:
+        assert test_fn(1) == 2
+    mock_capture.assert_not_called()
+    assert len(TRACE_BUFFER) == 0
+
+    mlflow.tracing.enable()
+    assert is_tracing_enabled()
+    assert test_fn(1) == 2
+    assert len(TRACE_BUFFER) == 1
+    TRACE_BUFFER.clear()
+
+
+def test_unsampled_traces_skip_span_processing(monkeypatch):
+    monkeypatch.setenv("MLFLOW_TRACE_SAMPLING_RATIO", "0.0")
+
+    @mlflow.trace
+    def child(x):
+        return x + 1
+
+    @mlflow.trace
+    def parent(x):
+        assert mlflow.get_current_active_span() is None
+        return child(x) + 1
+
+    with mock.patch.object(MlflowSpanProcessor, "on_start") as mock_on_start, mock.patch.object(
+        MlflowSpanProcessor, "on_end"
+    ) as mock_on_end:
+        assert parent(1) == 3
+        client = mlflow.MlflowClient()
+        client.end_trace(client.start_trace("client_trace").request_id)
+
+    mock_on_start.assert_not_called()
+    mock_on_end.assert_not_called()
+    assert len(TRACE_BUFFER) == 0
+
+
+def test_client_apis_are_no_op_for_unsampled_traces(monkeypatch):
+    monkeypatch.setenv("MLFLOW_TRACE_SAMPLING_RATIO", "0.0")
+    client = mlflow.MlflowClient()
+
+    root = client.start_trace("root")
+    assert root.request_id is not None
+    assert root.span_id is not None
+
+    child = client.start_span("child", request_id=root.request_id, parent_id=root.span_id)
+    assert child.request_id == root.request_id
+    assert child.parent_id == root.span_id
+    assert child.span_id not in (None, root.span_id)
+
+    client.end_span(child.request_id, child.span_id, outputs={"y": 1})
+    client.end_trace(root.request_id, outputs={"y": 1})
+
+    # Spans started with the client APIs under an unsampled fluent span are no-op too
+    with mlflow.start_span("fluent_root") as fluent_root:
+        child = client.start_span(
+            "child", request_id=fluent_root.request_id, parent_id=fluent_root.span_id
+        )
+        client.end_span(child.request_id, child.span_id)
+
+    assert len(TRACE_BUFFER) == 0
+    assert not InMemoryTraceManager.get_instance().is_unsampled_trace(root.request_id)
+    assert not InMemoryTraceManager.get_instance().is_unsampled_trace(fluent_root.request_id)
+
+
+@pytest.mark.parametrize("ratio", ["1.5", "-0.1", "invalid"])
+def test_invalid_sampling_ratio_falls_back_to_default(monkeypatch, ratio):
+    monkeypatch.setenv("MLFLOW_TRACE_SAMPLING_RATIO", ratio)
+
+    @mlflow.trace
+    def test_fn(x):
+        return x + 1
+
+    with mock.patch("mlflow.tracing.provider._logger.warning") as mock_warning:
+        assert test_fn(1) == 2
+        assert test_fn(1) == 2
+
+    mock_warning.assert_called_once()
+    assert "MLFLOW_TRACE_SAMPLING_RATIO" in mock_warning.call_args[0][0]
+    assert len(TRACE_BUFFER) == 2
+
+
+def test_otel_sampler_is_respected_without_sampling_ratio(monkeypatch):
+    monkeypatch.delenv("MLFLOW_TRACE_SAMPLING_RATIO", raising=False)
+    monkeypatch.setenv("OTEL_TRACES_SAMPLER", "always_off")
+
+    @mlflow.trace
+    def test_fn(x):
+        return x + 1
+
+    assert test_fn(1) == 2
+    assert len(TRACE_BUFFER) == 0
+
+
+def test_span_apis_return_no_op_span_when_disabled():
+    mlflow.tracing.disable()
+
+    with mlflow.start_span("fluent_root") as span:
+        assert type(span) is NoOpSpan
+        assert span.request_id is None
+        assert span.span_id is None
+
+    span = mlflow.MlflowClient().start_trace("client_root")
+    assert type(span) is NoOpSpan
+    assert span.request_id is None
+    assert span.span_id is None
+
+    mlflow.tracing.enable()
+    assert len(TRACE_BUFFER) == 0
@@ -35,6 +35,18 @@ def test_deduplicate_span_names():
     assert [span.span_id for span in spans] == [encode_span_id(i) for i in [0, 1, 2, 3, 4, 5]]
 
 
+def test_deduplicate_span_names_without_duplicates():
+    span_names = ["red", "blue", "green"]
+
+    spans = [
+        LiveSpan(create_mock_otel_span("trace_id", span_id=i, name=span_name), request_id="tr-123")
+        for i, span_name in enumerate(span_names)
+    ]
+    deduplicate_span_names_in_place(spans)
+
+    assert [span.name for span in spans] == span_names
+
+
 def test_maybe_get_request_id():
     assert maybe_get_request_id(is_evaluate=True) is None
 
@@ -1,5 +1,6 @@
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pydantic
@@ -131,7 +132,7 @@ def test_upload_trace_data(tmp_path, mock_store):
     trace_data = TraceData([span])
     trace_data_json = json.dumps(trace_data.to_dict(), cls=TraceJSONEncoder)
     with mock.patch(
-        "mlflow.store.artifact.artifact_repo.ArtifactRepository.upload_trace_data",
+        "mlflow.store.artifact.local_artifact_repo.LocalArtifactRepository.upload_trace_data",
     ) as mock_upload_trace_data:
         client = TrackingServiceClient(tmp_path.as_uri())
         client._upload_trace_data(trace_info=trace_info, trace_data=trace_data)
@@ -217,6 +218,17 @@ def test_search_traces(tmp_path):
         assert mock_download_trace_data.call_count == 4
 
 
+def test_search_traces_uses_configured_max_threads(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_SEARCH_TRACES_MAX_THREADS", "3")
+    client = TrackingServiceClient(tmp_path.as_uri())
+    with mock.patch.object(client, "_search_traces", return_value=([], None)), mock.patch(
+        "mlflow.tracking._tracking_service.client.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    ) as mock_executor:
+        client.search_traces(experiment_ids=["0"], max_results=2)
+
+    mock_executor.assert_called_once_with(max_workers=3)
+
+
 def test_search_traces_download_failures(tmp_path):
     client = TrackingServiceClient(tmp_path.as_uri())
 